@@ -0,0 +1,149 @@
+"""Micro-benchmark da conversão de linhas da importação.
+
+Compara o laço antigo (closure `cell()` recriada a cada linha, campos
+convertidos duas vezes) com o plano compilado por aba de `_compilar_plano`.
+Não toca no banco de dados.
+
+Uso:
+    python benchmarks/bench_conversao.py [--linhas 100000] [--repeticoes 3]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import (  # noqa: E402
+    _compilar_plano, _iterar_registros, _mapear_colunas, _normalize_header,
+    _novo_progresso, _parse_date, _parse_float
+)
+
+CABECALHO = [
+    'Unid', 'Dt Transação', 'Dt Emissão', 'Pedido', 'Cod Cli', 'Cliente', 'Título', 'Parc',
+    'CCusto', 'Dt Vencto', 'Vl Título R$', 'Vl Orig Tít R$', 'Comissão Venda',
+    'Comissão Serviço R$', 'DEV', 'Vendedor', 'Base Comissões R$', 'Perc',
+    'Vr Comissão R$', 'Previsão de Pgto', 'Status', 'Obs'
+]
+
+
+def gerar_linhas(quantidade, semente=42):
+    aleatorio = random.Random(semente)
+    vendedores = ['Cícero', 'MPBIOS', '50% MPBIOS/CICERO', 'ANA', 'BRUNO']
+    clientes = [f'CLIENTE {i} SAÚDE' for i in range(500)]
+    datas = [f'{dia:02d}/{mes:02d}/2025' for mes in range(1, 13) for dia in (5, 10, 20)]
+    linhas = []
+    for i in range(quantidade):
+        linhas.append((
+            1,
+            aleatorio.choice(datas),
+            datetime(2025, aleatorio.randint(1, 12), 1),
+            str(200000 + i),
+            str(aleatorio.randint(1, 900)),
+            aleatorio.choice(clientes),
+            str(300000 + i),
+            1,
+            '463109',
+            aleatorio.choice(datas),
+            f'{aleatorio.randint(1000, 999999)},{aleatorio.randint(0, 99):02d}',
+            float(aleatorio.randint(1000, 999999)),
+            0,
+            f'{aleatorio.randint(100, 9999)},{aleatorio.randint(0, 99):02d}',
+            f'DEV-{i:06d}/25',
+            aleatorio.choice(vendedores),
+            0,
+            0.1,
+            0,
+            aleatorio.choice(datas),
+            aleatorio.choice(['pendente', 'pago', 'aberta']),
+            '',
+        ))
+    return linhas
+
+
+def registros_legado(linhas, col_index):
+    """Cópia do laço de conversão anterior ao plano compilado."""
+    vistos = set()
+    for row in linhas:
+        if not any(row):
+            continue
+
+        def cell(field):
+            idx = col_index.get(field)
+            return row[idx - 1] if idx and idx <= len(row) else None
+
+        pedido_erecta = cell('pedido_erecta')
+        pedido_erecta = str(pedido_erecta).strip() if pedido_erecta else ''
+        if pedido_erecta:
+            chave = _normalize_header(pedido_erecta)
+            if chave in vistos:
+                continue
+            vistos.add(chave)
+
+        yield {
+            'unid': int(_parse_float(cell('unid')) or 1),
+            'dt_transacao': _parse_date(cell('dt_transacao')),
+            'dt_emissao': _parse_date(cell('dt_emissao')),
+            'pedido': str(cell('pedido')).strip() if cell('pedido') else '',
+            'cod_cli': str(cell('cod_cli')).strip() if cell('cod_cli') else '',
+            'cliente': str(cell('cliente')).strip() if cell('cliente') else '',
+            'titulo': str(cell('titulo')).strip() if cell('titulo') else '',
+            'parc': int(_parse_float(cell('parc')) or 1),
+            'ccusto': str(cell('ccusto')).strip() if cell('ccusto') else '',
+            'dt_vencto': _parse_date(cell('dt_vencto')),
+            'vl_titulo': _parse_float(cell('vl_titulo')),
+            'vl_orig_titulo': _parse_float(cell('vl_orig_titulo')),
+            'comissao_venda': _parse_float(cell('comissao_venda')),
+            'comissao_servico': _parse_float(cell('comissao_servico')),
+            'pedido_erecta': pedido_erecta,
+            'vendedor': str(cell('vendedor')).strip() if cell('vendedor') else '',
+            'base_comissao': _parse_float(cell('base_comissao')),
+            'percentual': _parse_float(cell('percentual')) or 10.0,
+            'vr_comissao': _parse_float(cell('vr_comissao')),
+            'dt_previsao': _parse_date(cell('dt_previsao')),
+            'status': str(cell('status')).strip().lower() if cell('status') else '',
+            'obs': str(cell('obs')).strip() if cell('obs') else ''
+        }
+
+
+def registros_compilados(linhas, col_index):
+    return _iterar_registros(iter(linhas), _compilar_plano(col_index), _novo_progresso())
+
+
+def medir(funcao, linhas, col_index, repeticoes):
+    melhor = None
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = list(funcao(linhas, col_index))
+        duracao = time.perf_counter() - inicio
+        melhor = duracao if melhor is None else min(melhor, duracao)
+    return melhor, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--linhas', type=int, default=100000)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    headers = {_normalize_header(valor): idx for idx, valor in enumerate(CABECALHO, start=1)}
+    col_index = _mapear_colunas(headers)
+    linhas = gerar_linhas(args.linhas)
+
+    tempo_antes, antes = medir(registros_legado, linhas, col_index, args.repeticoes)
+    tempo_depois, depois = medir(registros_compilados, linhas, col_index, args.repeticoes)
+
+    if antes != depois:
+        sys.exit('ERRO: o plano compilado gerou registros diferentes do laço antigo.')
+
+    print(f'linhas: {args.linhas}')
+    print(f'antes:  {args.linhas / tempo_antes:12,.0f} linhas/s ({tempo_antes:.3f}s)')
+    print(f'depois: {args.linhas / tempo_depois:12,.0f} linhas/s ({tempo_depois:.3f}s)')
+    print(f'ganho:  {tempo_antes / tempo_depois:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+"""Benchmark das rotas Flask com o test client, sobre um banco sintético.
+
+Cria um banco SQLite temporário com `--linhas` comissões (gerar_dados.py),
+mede latência (p50/p95/p99), linhas/s e pico de memória (tracemalloc) de
+index(), detalhes(), exportar(), importar() e excluir_multiplos(), e grava
+o resultado em JSON. Com `--comparar base.json`, sai com código 1 se o p95
+de alguma rota piorar mais que `--tolerancia`.
+
+Uso:
+    python benchmarks/bench_rotas.py [--linhas 100k] [--repeticoes 20] [--saida resultado.json]
+    python benchmarks/bench_rotas.py --comparar base.json --tolerancia 0.25
+"""
+import argparse
+import atexit
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from io import BytesIO
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+# O banco precisa estar definido antes de importar o app (o engine é criado na importação)
+_DIRETORIO = tempfile.mkdtemp(prefix='bench_rotas_')
+atexit.register(shutil.rmtree, _DIRETORIO, True)
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(_DIRETORIO, 'bench.db')
+
+from gerar_dados import VENDEDORES, gerar_xlsx, popular_banco, quantidade  # noqa: E402
+
+from app import Comissao, app, db  # noqa: E402
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    indice = min(len(ordenados) - 1, max(0, round(p / 100 * len(ordenados)) - 1))
+    return ordenados[indice]
+
+
+def medir(nome, requisicao, repeticoes, linhas_por_chamada=None):
+    """Executa requisicao() `repeticoes` vezes; a última roda sob tracemalloc."""
+    latencias = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resposta = requisicao()
+        resposta.get_data()  # consome respostas em streaming dentro da medição
+        resposta.close()
+        latencias.append(time.perf_counter() - inicio)
+        if resposta.status_code >= 400:
+            sys.exit(f'ERRO: {nome} respondeu {resposta.status_code}')
+
+    # Medido à parte: tracemalloc distorce a latência
+    tracemalloc.start()
+    resposta = requisicao()
+    resposta.get_data()
+    resposta.close()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    resultado = {
+        'repeticoes': repeticoes,
+        'p50_ms': round(percentil(latencias, 50) * 1000, 2),
+        'p95_ms': round(percentil(latencias, 95) * 1000, 2),
+        'p99_ms': round(percentil(latencias, 99) * 1000, 2),
+        'media_ms': round(statistics.fmean(latencias) * 1000, 2),
+        'pico_memoria_kb': round(pico / 1024, 1),
+    }
+    if linhas_por_chamada:
+        resultado['linhas_por_s'] = round(linhas_por_chamada / statistics.median(latencias))
+    return resultado
+
+
+def executar(args):
+    popular_banco(args.linhas, args.semente)
+    app.config['IMPORTACAO_ASSINCRONA'] = False
+    # Sem cache: cada repetição de index() paga as consultas
+    app.config['CACHE_DASHBOARD_TAMANHO'] = 0
+
+    with app.app_context():
+        ids = [i for (i,) in db.session.query(Comissao.id).order_by(Comissao.id)]
+    aleatorio = random.Random(args.semente)
+    cliente = app.test_client()
+    rotas = {}
+
+    rotas['index'] = medir('index', lambda: cliente.get('/'), args.repeticoes)
+    rotas['index_filtrado'] = medir(
+        'index_filtrado',
+        lambda: cliente.get('/', query_string={'vendedor': aleatorio.choice(VENDEDORES), 'status': 'pendente'}),
+        args.repeticoes)
+    rotas['index_busca_cliente'] = medir(
+        'index_busca_cliente', lambda: cliente.get('/', query_string={'cliente': 'hospital campinas'}), args.repeticoes)
+    rotas['index_pagina_500'] = medir(
+        'index_pagina_500', lambda: cliente.get('/', query_string={'por_pagina': 500, 'apos': ids[len(ids) // 2]}),
+        args.repeticoes, linhas_por_chamada=500)
+    rotas['detalhes'] = medir('detalhes', lambda: cliente.get(f'/detalhes/{aleatorio.choice(ids)}'), args.repeticoes)
+
+    with app.app_context():
+        total = Comissao.query.filter(Comissao.vendedor == VENDEDORES[0]).count()
+    rotas['exportar_csv'] = medir(
+        'exportar_csv',
+        lambda: cliente.get('/exportar', query_string={'formato': 'csv', 'vendedor': VENDEDORES[0]}),
+        max(1, args.repeticoes // 4), linhas_por_chamada=total)
+
+    # Uma planilha por chamada (+1 da rodada sob tracemalloc): repetir o mesmo
+    # arquivo cairia no atalho de "arquivo idêntico" e não mediria a importação
+    repeticoes_importacao = max(1, args.repeticoes // 10)
+    planilhas = []
+    for indice in range(repeticoes_importacao + 1):
+        caminho = gerar_xlsx(os.path.join(_DIRETORIO, f'importacao_{indice}.xlsx'),
+                             args.linhas_importacao, args.semente + 7 + indice)
+        with open(caminho, 'rb') as arquivo:
+            planilhas.append(arquivo.read())
+    conteudos = iter(planilhas)
+
+    def importar():
+        return cliente.post('/importar', data={'arquivo_excel': (BytesIO(next(conteudos)), 'bench.xlsx')},
+                            content_type='multipart/form-data')
+    rotas['importar'] = medir('importar', importar, repeticoes_importacao,
+                              linhas_por_chamada=args.linhas_importacao)
+
+    restantes = iter(ids[::-1])
+
+    def excluir_lote():
+        lote = [str(next(restantes)) for _ in range(args.lote_exclusao)]
+        return cliente.post('/excluir_multiplos', data={'ids': lote})
+    rotas['excluir_multiplos'] = medir('excluir_multiplos', excluir_lote, args.repeticoes,
+                                       linhas_por_chamada=args.lote_exclusao)
+
+    return {
+        'linhas': args.linhas,
+        'linhas_importacao': args.linhas_importacao,
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'rotas': rotas,
+    }
+
+
+def comparar(atual, base, tolerancia):
+    """Retorna as rotas cujo p95 piorou mais que a tolerância em relação à base."""
+    regressoes = []
+    for rota, medida in atual['rotas'].items():
+        anterior = base.get('rotas', {}).get(rota)
+        if anterior and medida['p95_ms'] > anterior['p95_ms'] * (1 + tolerancia):
+            regressoes.append((rota, anterior['p95_ms'], medida['p95_ms']))
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--linhas', type=quantidade, default=quantidade('10k'))
+    parser.add_argument('--linhas-importacao', type=quantidade, default=quantidade('5k'))
+    parser.add_argument('--repeticoes', type=int, default=20)
+    parser.add_argument('--lote-exclusao', type=int, default=100)
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--saida', help='arquivo JSON de resultado (padrão: stdout)')
+    parser.add_argument('--comparar', help='JSON de uma execução anterior')
+    parser.add_argument('--tolerancia', type=float, default=0.25)
+    args = parser.parse_args()
+
+    resultado = executar(args)
+    texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto + '\n')
+    else:
+        print(texto)
+
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as arquivo:
+            regressoes = comparar(resultado, json.load(arquivo), args.tolerancia)
+        for rota, antes, depois in regressoes:
+            print(f'REGRESSÃO {rota}: p95 {antes} ms -> {depois} ms', file=sys.stderr)
+        if regressoes:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+"""Gerador de dados sintéticos (determinístico por semente) para testes de carga.
+
+Produz comissões realistas (vendedores com rateio, clientes com acento,
+datas espalhadas em dois anos, status pago/pendente/atrasado) e grava em:
+
+- planilhas .xlsx no layout da importação, com as variantes de cabeçalho
+  reconhecidas por FIELD_MAP (`erp`, `alternativo` e `minimo`);
+- o banco configurado (DATABASE_URL), em lotes, com o resumo recalculado.
+
+Uso:
+    python benchmarks/gerar_dados.py xlsx --linhas 100k --saida /tmp/comissoes.xlsx [--variante alternativo]
+    DATABASE_URL=sqlite:////tmp/carga.db python benchmarks/gerar_dados.py banco --linhas 1m
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Rótulos de exibição; cada um normaliza para um alias de FIELD_MAP
+VARIANTES_CABECALHO = {
+    'erp': {
+        'unid': 'Unid', 'dt_transacao': 'Dt Transação', 'dt_emissao': 'Dt Emissão', 'pedido': 'Pedido',
+        'cod_cli': 'Cod Cli', 'cliente': 'Cliente', 'titulo': 'Título', 'parc': 'Parc',
+        'ccusto': 'CCusto', 'dt_vencto': 'Dt Vencto', 'vl_titulo': 'Vl Título R$',
+        'vl_orig_titulo': 'Vl Orig Tít R$', 'comissao_venda': 'Comissão Venda',
+        'comissao_servico': 'Comissão Serviço R$', 'pedido_erecta': 'DEV', 'vendedor': 'Vendedor',
+        'base_comissao': 'Base Comissões R$', 'percentual': 'Perc', 'vr_comissao': 'Vr Comissão R$',
+        'dt_previsao': 'Previsão de Pgto', 'status': 'Status', 'obs': 'Obs',
+    },
+    'alternativo': {
+        'unid': 'Unidade', 'dt_transacao': 'Data Transação', 'dt_emissao': 'Data Emissão', 'pedido': 'Pedido',
+        'cod_cli': 'Cód. Cliente', 'cliente': 'Cliente', 'titulo': 'Título', 'parc': 'Parcela',
+        'ccusto': 'Centro Custo', 'dt_vencto': 'Vencimento', 'vl_titulo': 'Valor Título',
+        'vl_orig_titulo': 'Val Orig Título', 'comissao_venda': 'Comissão Venda',
+        'comissao_servico': 'Valor Comissão Serviço R$', 'pedido_erecta': 'Pedido Interno',
+        'vendedor': 'Vendedor', 'base_comissao': 'Base Comissão', 'percentual': 'Percentual',
+        'vr_comissao': 'Valor Comissão', 'dt_previsao': 'Data Previsão', 'status': 'Situação',
+        'obs': 'Observações',
+    },
+    # Só o essencial, em outra ordem, para exercitar o mapeamento por nome
+    'minimo': {
+        'vendedor': 'Vendedor', 'cliente': 'Cliente', 'pedido': 'Pedido', 'pedido_erecta': 'DEV',
+        'dt_transacao': 'Dt Transação', 'dt_emissao': 'Dt Emissão', 'vl_titulo': 'Vl Título R$',
+        'dt_previsao': 'Previsão de Pgto', 'status': 'Status',
+    },
+}
+
+VENDEDORES = ['Cícero', 'MPBIOS', '50% MPBIOS/CICERO', 'Ana Paula', 'Bruno', 'João', 'Márcia', 'Regional Sul']
+PREFIXOS_CLIENTE = ['HOSPITAL', 'CLÍNICA', 'PREFEITURA MUNICIPAL DE', 'LABORATÓRIO', 'SANTA CASA DE', 'FUNDAÇÃO']
+CIDADES = ['SÃO PAULO', 'CAMPINAS', 'RIBEIRÃO PRETO', 'JUNDIAÍ', 'SOROCABA', 'BAURU', 'PIRACICABA', 'LIMEIRA']
+INICIO = date(2024, 1, 1)
+
+
+def quantidade(texto):
+    """Aceita 10000, 10k, 100k ou 1m."""
+    texto = str(texto).strip().lower()
+    multiplicador = {'k': 1000, 'm': 1000000}.get(texto[-1:], 1)
+    return int(float(texto.rstrip('km')) * multiplicador)
+
+
+def gerar_comissoes(total, semente=42):
+    """Gera dicionários com as colunas de Comissao (sem id)."""
+    aleatorio = random.Random(semente)
+    clientes = [f'{aleatorio.choice(PREFIXOS_CLIENTE)} {cidade} {i}'
+                for i, cidade in enumerate(CIDADES * 250)]
+    hoje = date.today()
+    for i in range(total):
+        dt_transacao = INICIO + timedelta(days=aleatorio.randint(0, 730))
+        dt_previsao = dt_transacao + timedelta(days=aleatorio.choice((30, 45, 60, 90)))
+        vl_titulo = round(aleatorio.lognormvariate(10, 1.2), 2)
+        comissao_venda = round(vl_titulo * aleatorio.choice((0, 0.02, 0.03)), 2)
+        comissao_servico = round(vl_titulo * aleatorio.choice((0, 0.01, 0.025)), 2)
+        base_comissao = round(comissao_venda + comissao_servico, 2)
+        percentual = aleatorio.choice((5.0, 10.0, 10.0, 15.0))
+        if aleatorio.random() < 0.55:
+            status = 'pago'
+        else:
+            status = 'atrasado' if dt_previsao < hoje else 'pendente'
+        yield {
+            'unid': 1,
+            'dt_transacao': dt_transacao,
+            'dt_emissao': dt_transacao - timedelta(days=aleatorio.randint(0, 30)),
+            'pedido': str(200000 + i),
+            'cod_cli': str(aleatorio.randint(1000, 9999)),
+            'cliente': aleatorio.choice(clientes),
+            'titulo': str(300000 + i),
+            'parc': aleatorio.randint(1, 3),
+            'ccusto': aleatorio.choice(('463109', '463110', '512000')),
+            'dt_vencto': dt_transacao + timedelta(days=30),
+            'vl_titulo': vl_titulo,
+            'vl_orig_titulo': round(vl_titulo * aleatorio.uniform(1, 1.2), 2),
+            'comissao_venda': comissao_venda,
+            'comissao_servico': comissao_servico,
+            'pedido_erecta': f'DEV-{i:07d}-{dt_transacao.year}',
+            'vendedor': aleatorio.choice(VENDEDORES),
+            'base_comissao': base_comissao,
+            'percentual': percentual,
+            'vr_comissao': round(base_comissao * percentual / 100, 2),
+            'dt_previsao': dt_previsao,
+            'status': status,
+            'obs': '' if aleatorio.random() < 0.8 else aleatorio.choice(('NF pendente', 'Rateio 50%', 'Aguardando cliente')),
+        }
+
+
+def _valor_planilha(campo, valor, aleatorio):
+    # Mistura os formatos que chegam das planilhas reais
+    if campo.startswith('dt_') and aleatorio.random() < 0.5:
+        return valor.strftime('%d/%m/%Y')
+    if campo in ('vl_titulo', 'comissao_servico', 'vr_comissao') and aleatorio.random() < 0.3:
+        return f'{valor:,.2f}'.translate(str.maketrans(',.', '.,'))
+    if campo == 'percentual':
+        return valor / 100
+    if campo == 'status':
+        return aleatorio.choice({'pago': ('pago', 'Ganha', 'PAGO'),
+                                 'pendente': ('pendente', 'Aberta', 'em aberto'),
+                                 'atrasado': ('atrasado', 'Vencida')}[valor])
+    return valor
+
+
+def gerar_xlsx(caminho, total, semente=42, variante='erp'):
+    """Grava uma planilha no layout da importação; retorna o caminho."""
+    from openpyxl import Workbook
+
+    rotulos = VARIANTES_CABECALHO[variante]
+    campos = list(rotulos)
+    aleatorio = random.Random(semente + 1)
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Comissões')
+    if variante != 'erp':
+        # Linha de título acima do cabeçalho, como nas planilhas exportadas do ERP
+        ws.append(['Acompanhamento de comissões'])
+    ws.append([rotulos[campo] for campo in campos])
+    for registro in gerar_comissoes(total, semente):
+        ws.append([_valor_planilha(campo, registro[campo], aleatorio) for campo in campos])
+    wb.save(caminho)
+    return caminho
+
+
+def popular_banco(total, semente=42, lote=5000):
+    """Insere `total` comissões no banco do app em lotes e recalcula resumo e rateios."""
+    from sqlalchemy import insert
+
+    from app import Comissao, _incrementar_versao, _recalcular_resumo, _sincronizar_divisoes, app, db, init_db
+
+    init_db()
+    with app.app_context():
+        bloco = []
+        for registro in gerar_comissoes(total, semente):
+            bloco.append(registro)
+            if len(bloco) >= lote:
+                db.session.execute(insert(Comissao), bloco)
+                db.session.commit()
+                bloco = []
+        if bloco:
+            db.session.execute(insert(Comissao), bloco)
+        _recalcular_resumo()
+        _sincronizar_divisoes()
+        _incrementar_versao()
+        db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('destino', choices=('xlsx', 'banco'))
+    parser.add_argument('--linhas', type=quantidade, default=quantidade('10k'))
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--saida', default='comissoes_sinteticas.xlsx')
+    parser.add_argument('--variante', choices=sorted(VARIANTES_CABECALHO), default='erp')
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    if args.destino == 'xlsx':
+        gerar_xlsx(args.saida, args.linhas, args.semente, args.variante)
+        destino = args.saida
+    else:
+        popular_banco(args.linhas, args.semente)
+        destino = os.environ.get('DATABASE_URL', 'banco padrão')
+    duracao = time.perf_counter() - inicio
+    print(f'{args.linhas} linhas -> {destino} em {duracao:.1f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""Paridade da conversão de linhas da importação.
+
+Confere que o plano compilado (`_iterar_registros` + `_preparar_registro`)
+gera exatamente os mesmos registros que o laço de referência de
+bench_conversao.py, com casos de borda, linhas sintéticas e a planilha de
+exemplo do repositório. Sai com código 1 se houver divergência.
+
+Uso:
+    python benchmarks/paridade_conversao.py [--linhas 100000]
+"""
+import argparse
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from openpyxl import load_workbook  # noqa: E402
+
+from app import (  # noqa: E402
+    _compilar_plano, _detectar_cabecalho, _iterar_registros, _mapear_colunas,
+    _normalize_header, _novo_progresso, _registros_validos
+)
+from bench_conversao import CABECALHO, gerar_linhas, registros_legado  # noqa: E402
+
+ONTEM = datetime.combine(date.today() - timedelta(days=1), datetime.min.time())
+AMANHA = (date.today() + timedelta(days=1)).strftime('%d/%m/%Y')
+
+CASOS_DE_BORDA = [
+    (None, None, None, '1', '', 'CLIENTE A', None, None, None, None, None, None, None, None,
+     'DEV-1/25', 'ANA', None, None, None, None, None, None),
+    ('2', '2025-03-04', '04-03-2025', 10, 4923, '  Cliente B  ', 7, '2,0', 463109, 'xx/yy',
+     ' 1.234,56 ', 'abc', '', '  ', 'dev 1/25', 'ANA', 0, 1, 0, ONTEM, 'Ganha', 'obs'),
+    (1, ONTEM, date(2024, 1, 2), '3', None, 'CLIENTE C', None, 1, None, None,
+     100.5, 200, 10, 20, 'DEV-2/25', 'Cícero', 0, 0.5, 0, ONTEM, 'VENCIDA', None),
+    (1, ONTEM, ONTEM, '4', None, 'CLIENTE D', None, 1, None, None,
+     100.5, 200, 10, 20, 'DEV-3/25', 'Cícero', 50, 0, 7.5, AMANHA, 'em aberto', 'x'),
+    (1, ONTEM, ONTEM, '5', None, '', None, 1, None, None,
+     1, 1, 1, 1, 'DEV-4/25', 'Cícero', 1, 1, 1, AMANHA, 'pago', None),
+    (1, ONTEM, ONTEM, 0, None, 'CLIENTE E', None, 1, None, None,
+     1, 1, 1, 1, 'DEV-5/25', 'Cícero', 1, 1, 1, AMANHA, 'pago', None),
+    (1, ONTEM, ONTEM, '6', None, 'CLIENTE F', None, 1, None, None,
+     '-3,5', 1, 1, 1, None, 'Cícero', 1, 1, 1, '2025-13-40', 'Pendente'),
+    (None,) * 22,
+    (1, '31/12/2024', ONTEM, '7', None, 'CLIENTE G', None, 1, None, None,
+     1, 1, 1, 1, 'DEV-2/25', 'Cícero', 1, 1, 1, '31/12/2024', 'pago', 'duplicado'),
+]
+
+
+def referencia(linhas, col_index):
+    progresso = _novo_progresso()
+    return list(_registros_validos(registros_legado(linhas, col_index), progresso))
+
+
+def compilado(linhas, col_index):
+    progresso = _novo_progresso()
+    registros = _registros_validos(_iterar_registros(iter(linhas), _compilar_plano(col_index), progresso), progresso)
+    return list(registros)
+
+
+def comparar(nome, linhas, col_index):
+    esperado = referencia(linhas, col_index)
+    obtido = compilado(linhas, col_index)
+    if esperado != obtido:
+        for posicao, (a, b) in enumerate(zip(esperado, obtido)):
+            if a != b:
+                print(f'{nome}: primeira divergência no registro {posicao}:')
+                for campo in a:
+                    if a[campo] != b.get(campo):
+                        print(f'  {campo}: referência={a[campo]!r} compilado={b.get(campo)!r}')
+                break
+        print(f'{nome}: {len(esperado)} registros na referência, {len(obtido)} no plano compilado')
+        return False
+    print(f'{nome}: {len(esperado)} registros idênticos')
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--linhas', type=int, default=100000)
+    args = parser.parse_args()
+
+    headers = {_normalize_header(valor): idx for idx, valor in enumerate(CABECALHO, start=1)}
+    col_index = _mapear_colunas(headers)
+
+    iguais = comparar('casos de borda', CASOS_DE_BORDA, col_index)
+    iguais &= comparar('sintético', gerar_linhas(args.linhas), col_index)
+
+    exemplo = os.path.join(RAIZ, 'Acompanhamento de comissões.xlsx')
+    if os.path.exists(exemplo):
+        wb = load_workbook(exemplo, read_only=True, data_only=True)
+        ws = wb.active
+        header_row_index, headers_exemplo = _detectar_cabecalho(ws)
+        linhas_exemplo = list(ws.iter_rows(min_row=header_row_index + 1, values_only=True))
+        wb.close()
+        iguais &= comparar('planilha de exemplo', linhas_exemplo, _mapear_colunas(headers_exemplo))
+
+    if not iguais:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
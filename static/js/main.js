@@ -7,9 +7,9 @@ document.addEventListener('DOMContentLoaded', function() {
         return new bootstrap.Tooltip(tooltipTriggerEl)
     });
 
-    // Auto-hide alerts após 5 segundos
+    // Auto-hide alerts após 5 segundos (exceto os de acompanhamento)
     setTimeout(function() {
-        var alerts = document.querySelectorAll('.alert');
+        var alerts = document.querySelectorAll('.alert:not(.alert-persistente)');
         alerts.forEach(function(alert) {
             var bsAlert = new bootstrap.Alert(alert);
             bsAlert.close();
@@ -21,3 +21,43 @@ document.addEventListener('DOMContentLoaded', function() {
 function formatarMoeda(valor) {
     return valor.toLocaleString('pt-BR', { style: 'currency', currency: 'BRL' });
 }
+
+// Cache em memória dos detalhes das comissões exibidas, válido para uma versão dos dados
+var cacheDetalhes = {
+    url: null,
+    versao: null,
+    registros: new Map(),
+
+    configurar: function(url, versao) {
+        this.url = url;
+        this.definirVersao(String(versao));
+    },
+
+    definirVersao: function(versao) {
+        if (this.versao !== versao) {
+            this.registros.clear();
+            this.versao = versao;
+        }
+    },
+
+    // Busca em uma única requisição os ids que ainda não estão no cache
+    carregar: function(ids) {
+        var self = this;
+        var faltando = ids.filter(function(id) { return !self.registros.has(String(id)); });
+        if (!self.url || faltando.length === 0) return Promise.resolve();
+        return fetch(self.url + '?ids=' + faltando.join(','), { cache: 'no-cache' })
+            .then(function(response) { return response.json(); })
+            .then(function(data) {
+                // Dados alterados desde que a página foi gerada: descarta o que havia
+                self.definirVersao(String(data.versao));
+                Object.keys(data.registros).forEach(function(id) {
+                    self.registros.set(id, data.registros[id]);
+                });
+            });
+    },
+
+    obter: function(id) {
+        var self = this;
+        return self.carregar([id]).then(function() { return self.registros.get(String(id)); });
+    }
+};